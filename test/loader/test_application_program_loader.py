@@ -0,0 +1,173 @@
+"""Test application program loader."""
+
+from __future__ import annotations
+
+from io import BytesIO
+from zipfile import Path, ZipFile
+
+import pytest
+
+from xknxproject.loader import ApplicationProgramLoader
+from xknxproject.models import (
+    ComObjectInstanceRef,
+    DeviceInstance,
+    XMLArea,
+    XMLLine,
+)
+
+APPLICATION_PROGRAM_ID = "M-0083_A-0001-10-0000"
+APPLICATION_PROGRAM_FILE = f"M-0083/{APPLICATION_PROGRAM_ID}.xml"
+
+# prefixed namespace declared before the default namespace
+APPLICATION_PROGRAM_XML = f"""<?xml version="1.0" encoding="utf-8"?>
+<KNX xmlns:xsi="http://www.w3.org/2001/XMLSchema-instance" xmlns="http://knx.org/xml/project/21">
+  <ManufacturerData>
+    <Manufacturer RefId="M-0083">
+      <ApplicationPrograms>
+        <ApplicationProgram Id="{APPLICATION_PROGRAM_ID}">
+          <Static>
+            <ComObjectTable>
+              <ComObject Id="{APPLICATION_PROGRAM_ID}_O-1" Name="Switch" Text="Switch" Number="1" FunctionText="On/Off" ObjectSize="1 Bit" ReadFlag="Disabled" WriteFlag="Enabled" CommunicationFlag="Enabled" TransmitFlag="Enabled" UpdateFlag="Disabled" ReadOnInitFlag="Disabled" DatapointType="DPST-1-1" />
+            </ComObjectTable>
+            <ComObjectRefs>
+              <ComObjectRef Id="{APPLICATION_PROGRAM_ID}_O-1_R-1" RefId="{APPLICATION_PROGRAM_ID}_O-1" />
+            </ComObjectRefs>
+          </Static>
+        </ApplicationProgram>
+      </ApplicationPrograms>
+      <Languages>
+        <Language Identifier="de-DE">
+          <TranslationUnit RefId="{APPLICATION_PROGRAM_ID}">
+            <TranslationElement RefId="{APPLICATION_PROGRAM_ID}_O-1">
+              <Translation AttributeName="Text" Text="Schalten" />
+              <Translation AttributeName="FunctionText" Text="Ein/Aus" />
+            </TranslationElement>
+          </TranslationUnit>
+        </Language>
+      </Languages>
+    </Manufacturer>
+  </ManufacturerData>
+</KNX>
+"""
+
+
+def _device() -> DeviceInstance:
+    """Return a device using the ComObjectRef of the application program."""
+    area = XMLArea(address=1, name="Area", description=None, lines=[])
+    line = XMLLine(
+        address=1,
+        description=None,
+        name="Line",
+        medium_type="TP",
+        devices=[],
+        area=area,
+    )
+    com_object_instance_ref = ComObjectInstanceRef(
+        identifier=None,
+        ref_id="O-1_R-1",
+        text=None,
+        function_text=None,
+        read_flag=None,
+        write_flag=None,
+        communication_flag=None,
+        transmit_flag=None,
+        update_flag=None,
+        read_on_init_flag=None,
+        datapoint_types=[],
+        description=None,
+        channel=None,
+        links=None,
+        com_object_ref_id=f"{APPLICATION_PROGRAM_ID}_O-1_R-1",
+    )
+    device = DeviceInstance(
+        identifier="P-0001-0_DI-1",
+        address=1,
+        project_uid=None,
+        name="",
+        description="",
+        last_modified="",
+        product_ref="M-0083_H-1-O1_P-1",
+        hardware_program_ref="M-0083_H-1-O1_HP-1",
+        line=line,
+        manufacturer="M-0083",
+        additional_addresses=[],
+        channels=[],
+        com_object_instance_refs=[com_object_instance_ref],
+        module_instances=[],
+        parameter_instance_refs={},
+    )
+    device.application_program_ref = APPLICATION_PROGRAM_ID
+    return device
+
+
+def test_load_prefixed_namespace_before_default():
+    """Test the default namespace is used if a prefixed one is declared first."""
+    buffer = BytesIO()
+    with ZipFile(buffer, mode="w") as archive:
+        archive.writestr(APPLICATION_PROGRAM_FILE, APPLICATION_PROGRAM_XML)
+
+    with ZipFile(buffer) as archive:
+        application = ApplicationProgramLoader.load_from_archive(
+            archive, APPLICATION_PROGRAM_FILE, [_device()], language_code="de-DE"
+        )
+
+    com_object = application.com_objects[f"{APPLICATION_PROGRAM_ID}_O-1"]
+    assert com_object.name == "Switch"
+    assert com_object.number == 1
+    assert com_object.write_flag is True
+    assert com_object.read_flag is False
+    # translated
+    assert com_object.text == "Schalten"
+    assert com_object.function_text == "Ein/Aus"
+
+    com_object_ref = application.com_object_refs[f"{APPLICATION_PROGRAM_ID}_O-1_R-1"]
+    assert com_object_ref.ref_id == f"{APPLICATION_PROGRAM_ID}_O-1"
+
+
+def test_load_path():
+    """Test loading from a zipfile.Path."""
+    buffer = BytesIO()
+    with ZipFile(buffer, mode="w") as archive:
+        archive.writestr(APPLICATION_PROGRAM_FILE, APPLICATION_PROGRAM_XML)
+
+    with ZipFile(buffer) as archive:
+        application = ApplicationProgramLoader.load(
+            Path(archive, APPLICATION_PROGRAM_FILE), [_device()], language_code=None
+        )
+
+    com_object = application.com_objects[f"{APPLICATION_PROGRAM_ID}_O-1"]
+    assert com_object.text == "Switch"
+    assert f"{APPLICATION_PROGRAM_ID}_O-1_R-1" in application.com_object_refs
+
+
+@pytest.mark.parametrize(
+    ("value", "expected"),
+    [
+        ("Enabled", True),
+        ("Disabled", False),
+        (None, None),  # missing - inherited from the ComObject
+        ("Unknown", False),
+    ],
+)
+def test_parse_com_object_ref_flags(value, expected):
+    """Test parsing knx:Enable_t flags of a ComObjectRef."""
+    attrib = {"Id": "O-1_R-1", "RefId": "O-1"}
+    if value is not None:
+        attrib |= dict.fromkeys(
+            (
+                "ReadFlag",
+                "WriteFlag",
+                "CommunicationFlag",
+                "TransmitFlag",
+                "UpdateFlag",
+                "ReadOnInitFlag",
+            ),
+            value,
+        )
+    com_object_ref = ApplicationProgramLoader.parse_com_object_ref(attrib, "O-1_R-1")
+    assert com_object_ref.read_flag is expected
+    assert com_object_ref.write_flag is expected
+    assert com_object_ref.communication_flag is expected
+    assert com_object_ref.transmit_flag is expected
+    assert com_object_ref.update_flag is expected
+    assert com_object_ref.read_on_init_flag is expected
@@ -0,0 +1,101 @@
+"""Test hardware loader."""
+
+from __future__ import annotations
+
+from io import BytesIO
+from zipfile import Path, ZipFile
+
+from xknxproject.loader import HardwareLoader
+
+HARDWARE_FILE = "M-0083/Hardware.xml"
+
+# prefixed namespace declared before the default namespace
+HARDWARE_XML = """<?xml version="1.0" encoding="utf-8"?>
+<KNX xmlns:xsi="http://www.w3.org/2001/XMLSchema-instance" xmlns="http://knx.org/xml/project/21">
+  <ManufacturerData>
+    <Manufacturer RefId="M-0083">
+      <Hardware>
+        <Hardware Id="M-0083_H-1" Name="Switch actuator">
+          <Products>
+            <Product Id="M-0083_H-1_P-1" Text="Switch actuator 4-fold" OrderNumber="SA-4" />
+          </Products>
+          <Hardware2Programs>
+            <Hardware2Program Id="M-0083_H-1_HP-1">
+              <ApplicationProgramRef RefId="M-0083_A-0001-10-0000" />
+              <ApplicationProgramRef RefId="M-0083_A-0001-11-0000" />
+            </Hardware2Program>
+          </Hardware2Programs>
+        </Hardware>
+      </Hardware>
+      <Languages>
+        <Language Identifier="de-DE">
+          <TranslationUnit RefId="M-0083_H-1">
+            <TranslationElement RefId="M-0083_H-1_P-1">
+              <Translation AttributeName="Text" Text="Schaltaktor 4-fach" />
+            </TranslationElement>
+          </TranslationUnit>
+        </Language>
+        <Language Identifier="fr-FR">
+          <TranslationUnit RefId="M-0083_H-1">
+            <TranslationElement RefId="M-0083_H-1_P-1">
+              <Translation AttributeName="Text" Text="Actionneur 4 canaux" />
+            </TranslationElement>
+          </TranslationUnit>
+        </Language>
+      </Languages>
+    </Manufacturer>
+  </ManufacturerData>
+</KNX>
+"""
+
+
+def test_load_prefixed_namespace_before_default():
+    """Test the default namespace is used if a prefixed one is declared first."""
+    buffer = BytesIO()
+    with ZipFile(buffer, mode="w") as archive:
+        archive.writestr(HARDWARE_FILE, HARDWARE_XML)
+
+    with ZipFile(buffer) as archive:
+        products, hardware_programs = HardwareLoader.load_from_archive(
+            archive, HARDWARE_FILE, language_code="de-DE"
+        )
+
+    assert list(products) == ["M-0083_H-1_P-1"]
+    product = products["M-0083_H-1_P-1"]
+    assert product.text == "Schaltaktor 4-fach"
+    assert product.order_number == "SA-4"
+    assert product.hardware_name == "Switch actuator"
+    # only the first ApplicationProgramRef is used
+    assert hardware_programs == {"M-0083_H-1_HP-1": "M-0083_A-0001-10-0000"}
+
+
+def test_load_path():
+    """Test loading from a zipfile.Path."""
+    buffer = BytesIO()
+    with ZipFile(buffer, mode="w") as archive:
+        archive.writestr(HARDWARE_FILE, HARDWARE_XML)
+
+    with ZipFile(buffer) as archive:
+        products, hardware_programs = HardwareLoader.load(
+            Path(archive, HARDWARE_FILE), language_code=None
+        )
+
+    assert products["M-0083_H-1_P-1"].text == "Switch actuator 4-fold"
+    assert hardware_programs == {"M-0083_H-1_HP-1": "M-0083_A-0001-10-0000"}
+
+
+def test_load_language_identifier_with_whitespace():
+    """Test the requested language is found with whitespace around `=`."""
+    buffer = BytesIO()
+    with ZipFile(buffer, mode="w") as archive:
+        archive.writestr(
+            HARDWARE_FILE,
+            HARDWARE_XML.replace('Identifier="de-DE"', "Identifier = 'de-DE'"),
+        )
+
+    with ZipFile(buffer) as archive:
+        products, _ = HardwareLoader.load_from_archive(
+            archive, HARDWARE_FILE, language_code="de-DE"
+        )
+
+    assert products["M-0083_H-1_P-1"].text == "Schaltaktor 4-fach"
@@ -0,0 +1,11 @@
+"""Test models."""
+
+from __future__ import annotations
+
+from xknxproject.models import Product
+
+
+def test_product_default_hardware_name():
+    """Test Product can be created without a hardware name."""
+    product = Product(identifier="M-0083_H-1-O1", text="Switch", order_number="123")
+    assert product.hardware_name == ""
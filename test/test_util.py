@@ -54,6 +54,23 @@ def test_parse_dpt_types(dpt_string, expected):
     assert util.parse_dpt_types(dpt_string) == expected
 
 
+def test_parse_dpt_types_not_shared():
+    """Test cached DPT parsing returns independent objects."""
+    first = util.parse_dpt_types("DPST-1-1")
+    first[0]["sub"] = 2
+    assert util.parse_dpt_types("DPST-1-1") == [{"main": 1, "sub": 1}]
+    assert util.get_dpt_type("DPST-1-1") is not util.get_dpt_type("DPST-1-1")
+
+
+def test_intern_optional():
+    """Test interning optional strings."""
+    assert util.intern_optional(None) is None
+    first = util.intern_optional("".join(["1", " ", "Bit"]))
+    second = util.intern_optional("".join(["1 ", "Bit"]))
+    assert first == "1 Bit"
+    assert first is second
+
+
 @pytest.mark.parametrize(
     ("text", "parameter", "expected"),
     [
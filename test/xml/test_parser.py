@@ -1,7 +1,11 @@
 """Test parser."""
 
+from pathlib import Path
+from zipfile import ZipFile
+
 import pytest
 
+from xknxproject.exceptions import UnexpectedDataError
 from xknxproject.xml.parser import XMLParser
 from xknxproject.zip import extract
 
@@ -119,3 +123,101 @@ def test_parse_project_with_module_defs():
     assert len(parser.areas[1].lines[1].devices) == 4
 
     assert len(parser.devices) == 4
+
+
+SECOND_INSTALLATION = """<Installation Name="Second">
+        <Locations>
+          <Space Type="Building" Id="P-01D2-1_BP-1" Name="Second building" Puid="100" />
+        </Locations>
+        <GroupAddresses>
+          <GroupRanges>
+            <GroupRange Id="P-01D2-1_GR-1" RangeStart="28672" RangeEnd="30719" Name="Second main" Puid="101">
+              <GroupRange Id="P-01D2-1_GR-2" RangeStart="28672" RangeEnd="28927" Name="Second middle" Puid="102">
+                <GroupAddress Id="P-01D2-1_GA-1" Address="28672" Name="Second" Puid="103" />
+              </GroupRange>
+            </GroupRange>
+          </GroupRanges>
+        </GroupAddresses>
+      </Installation>
+    </Installations>"""
+
+
+def _patch_project_ets5(project_path: Path, old: str, new: str) -> None:
+    """Write a copy of the ETS5 test project with a replacement in its 0.xml."""
+    with (
+        ZipFile(xknx_test_project_ets5) as source,
+        ZipFile(project_path, mode="w") as target,
+    ):
+        for name in source.namelist():
+            data = source.read(name)
+            if name == "P-01D2/0.xml":
+                data = data.replace(old.encode(), new.encode(), 1)
+            target.writestr(name, data)
+
+
+def test_parse_project_multiple_installations(tmp_path):
+    """Test items of all Installations are parsed."""
+    project_path = tmp_path / "two_installations.knxproj"
+    _patch_project_ets5(project_path, "</Installations>", SECOND_INSTALLATION)
+
+    with extract(project_path) as knx_project_contents:
+        parser = XMLParser(knx_project_contents)
+        parser.parse()
+
+    assert {ga.address for ga in parser.group_addresses} == {
+        # first Installation
+        "1/0/0",
+        "1/0/1",
+        "1/0/2",
+        "1/0/3",
+        "1/0/4",
+        "1/0/5",
+        "2/0/6",
+        # second Installation
+        "14/0/0",
+    }
+    assert [space.name for space in parser.spaces] == ["Test2", "Second building"]
+    assert [group_range.name for group_range in parser.group_ranges][-1] == (
+        "Second main"
+    )
+
+
+def test_parse_com_object_instance_ref_flags(tmp_path):
+    """Test knx:Enable_t flags of a ComObjectInstanceRef."""
+    project_path = tmp_path / "flags.knxproj"
+    _patch_project_ets5(
+        project_path,
+        '<ComObjectInstanceRef RefId="O-4_R-1417"',
+        '<ComObjectInstanceRef RefId="O-4_R-1417" ReadFlag="Enabled" '
+        'TransmitFlag="Disabled" WriteFlag="Unknown"',
+    )
+
+    with extract(project_path) as knx_project_contents:
+        parser = XMLParser(knx_project_contents)
+        parser.parse()
+
+    com_object_instance_ref = next(
+        com_object_instance_ref
+        for device in parser.devices
+        for com_object_instance_ref in device.com_object_instance_refs
+        if com_object_instance_ref.ref_id == "O-4_R-1417"
+    )
+    assert com_object_instance_ref.read_flag is True
+    assert com_object_instance_ref.transmit_flag is False
+    # unknown values are False - not inherited from the ComObject(Ref)
+    assert com_object_instance_ref.write_flag is False
+    # missing flags are inherited from the ComObject(Ref)
+    assert com_object_instance_ref.communication_flag is True
+    assert com_object_instance_ref.update_flag is True
+    assert com_object_instance_ref.read_on_init_flag is False
+
+
+def test_parse_project_without_namespace(tmp_path):
+    """Test a project file without namespace is rejected."""
+    project_path = tmp_path / "no_namespace.knxproj"
+    _patch_project_ets5(project_path, ' xmlns="http://knx.org/xml/project/20"', "")
+
+    with extract(project_path) as knx_project_contents:
+        parser = XMLParser(knx_project_contents)
+        with pytest.raises(UnexpectedDataError, match="has no namespace"):
+            parser.parse()
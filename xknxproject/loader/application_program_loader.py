@@ -2,10 +2,10 @@
 
 from __future__ import annotations
 
-from collections.abc import Iterator
-from typing import Any
+from collections.abc import Callable
+from dataclasses import dataclass
 from xml.etree import ElementTree
-from zipfile import Path
+from zipfile import Path, ZipFile
 
 from xknxproject.models import (
     Allocator,
@@ -17,7 +17,25 @@ from xknxproject.models import (
     ModuleDefinitionArgumentInfo,
     ModuleDefinitionNumericArg,
 )
-from xknxproject.util import parse_dpt_types, parse_xml_flag
+from xknxproject.util import intern_optional, parse_dpt_types, parse_xml_flag
+
+_READ_CHUNK_SIZE = 65536
+# files up to this uncompressed size are fed to the parser in a single call
+_SINGLE_READ_MAX_SIZE = 4 * 1024 * 1024
+
+
+class _ParsingDone(Exception):
+    """Raised by the parser target when no further elements are needed."""
+
+
+@dataclass
+class _Translation:
+    """Translated texts of a TranslationElement."""
+
+    __slots__ = ("function_text", "text")
+
+    text: str | None
+    function_text: str | None
 
 
 class ApplicationProgramLoader:
@@ -30,216 +48,118 @@ class ApplicationProgramLoader:
         language_code: str | None,
     ) -> ApplicationProgram:
         """Load Hardware mappings and assign to devices."""
-        com_object_instance_refs = [
-            instance_ref
-            for device in devices
-            for instance_ref in device.com_object_instance_refs
-        ]
+        return ApplicationProgramLoader.load_from_archive(
+            archive=application_program_path.root,
+            application_program_file=application_program_path.at,
+            devices=devices,
+            language_code=language_code,
+        )
+
+    @staticmethod
+    def load_from_archive(
+        archive: ZipFile,
+        application_program_file: str,
+        devices: list[DeviceInstance],
+        language_code: str | None,
+    ) -> ApplicationProgram:
+        """Load an application program from a member of the project archive."""
         used_com_object_ref_ids = {
             instance_ref.com_object_ref_id
-            for instance_ref in com_object_instance_refs
+            for device in devices
+            for instance_ref in device.com_object_instance_refs
             if instance_ref.com_object_ref_id is not None
         }
-        com_object_refs: dict[str, ComObjectRef] = {}  # {Id: ComObjectRef}
-        com_objects: dict[str, ComObject] = {}  # {Id: ComObject}
-
         used_module_arguments: dict[str, ModuleDefinitionArgumentInfo] = {
             attribute.ref_id: ModuleDefinitionArgumentInfo()
             for device in devices
             for attribute in device.module_instance_arguments()
         }
-        numeric_args: dict[str, ModuleDefinitionNumericArg] = {}
-        channels: dict[
-            str, ApplicationProgramChannel
-        ] = {}  # {Id: ApplicationProgramChannel}
-        allocators: dict[str, Allocator] = {}
-
-        with application_program_path.open(mode="rb") as application_xml:
-            tree_iterator = ElementTree.iterparse(application_xml, events=("start",))
-            # get namespace from root element
-            _, elem = next(tree_iterator)
-            namespace = elem.tag.split("KNX", maxsplit=1)[0]
-            # define namespaced tag strings for faster comparison - ~15% faster
-            # than elem.tag.endswith("tagname") or elem.tag == f"{namespace}tagname"
-            ns_com_object = f"{namespace}ComObject"
-            ns_com_object_ref = f"{namespace}ComObjectRef"
-            ns_allocator = f"{namespace}Allocator"
-            ns_argument = f"{namespace}Argument"
-            ns_numeric_arg = f"{namespace}NumericArg"
-            ns_channel = f"{namespace}Channel"
-            ns_languages = f"{namespace}Languages"
-
-            for _, elem in tree_iterator:
-                if elem.tag == ns_com_object:
-                    # we take all since we don't know which are referenced to yet
-                    identifier = elem.attrib.get("Id")
-                    com_objects[identifier] = ApplicationProgramLoader.parse_com_object(
-                        elem, identifier
-                    )
-                elif elem.tag == ns_com_object_ref:
-                    if (_id := elem.attrib.get("Id")) in used_com_object_ref_ids:
-                        com_object_refs[_id] = (
-                            ApplicationProgramLoader.parse_com_object_ref(elem, _id)
-                        )
-                    elem.clear()
-                elif elem.tag == ns_allocator:  # Allocators/Allocator
-                    allocators[elem.attrib.get("Id")] = Allocator(
-                        identifier=elem.attrib.get("Id"),
-                        name=elem.attrib.get("Name"),
-                        start=int(elem.attrib.get("Start")),
-                        end=int(elem.attrib.get("maxInclusive")),
-                    )
-                elif elem.tag == ns_argument:
-                    # ModuleDefs/ModuleDef/Arguments/
-                    # or ModuleDefs/ModuleDef/SubModuleDefs/ModuleDef/Arguments/
-                    if (_id := elem.attrib.get("Id")) in used_module_arguments:
-                        allocates = elem.attrib.get("Allocates")
-                        used_module_arguments[_id] = ModuleDefinitionArgumentInfo(
-                            name=elem.attrib.get("Name"),
-                            allocates=int(allocates) if allocates is not None else None,
-                        )
-                    elem.clear()
-                elif elem.tag == ns_numeric_arg:
-                    # in dynamic section of Modules
-                    if (_id := elem.attrib.get("RefId")) in used_module_arguments:
-                        value = elem.attrib.get("Value")
-                        numeric_args[_id] = ModuleDefinitionNumericArg(
-                            allocator_ref_id=elem.attrib.get("AllocatorRefId"),
-                            base_value=elem.attrib.get("BaseValue"),
-                            value=int(value) if value is not None else None,
-                        )
-                    elem.clear()
-                elif elem.tag == ns_channel:
-                    _id = elem.attrib.get("Id")
-                    channels[_id] = ApplicationProgramChannel(
-                        identifier=_id,
-                        name=elem.attrib.get("Name"),
-                        number=elem.attrib.get("Number"),
-                        text=elem.attrib.get("Text"),
-                        text_parameter_ref_id=elem.attrib.get("TextParameterRefId"),
-                    )
-                    elem.clear()
-                elif elem.tag == ns_languages:
-                    elem.clear()
-                    # hold iterator for optional translation parsing
-                    break
-                elem.clear()
-
-            if language_code is not None:
-                ApplicationProgramLoader.parse_translations(
-                    tree_iterator=tree_iterator,
-                    namespace=namespace,
-                    com_objects=com_objects,
-                    com_object_refs=com_object_refs,
-                    used_com_object_ref_ids=used_com_object_ref_ids,
-                    channels=channels,
-                    language_code=language_code,
-                )
-
-            return ApplicationProgram(
-                com_objects=com_objects,
-                com_object_refs=com_object_refs,
-                allocators=allocators,
-                module_def_arguments=used_module_arguments,
-                numeric_args=numeric_args,
-                channels=channels,
-            )
-
-    @staticmethod
-    def parse_translations(
-        tree_iterator: Iterator[tuple[str, Any]],
-        namespace: str,
-        com_objects: dict[str, ComObject],
-        com_object_refs: dict[str, ComObjectRef],
-        used_com_object_ref_ids: set[str],
-        channels: dict[str, ApplicationProgramChannel],
-        language_code: str,
-    ) -> None:
-        """Parse translations. Replace translated text in com_objects and com_object_refs."""
-        _used_com_object_ids = {
-            com_object_ref.ref_id for com_object_ref in com_object_refs.values()
-        }
-        used_translation_ids = (
-            _used_com_object_ids | used_com_object_ref_ids | channels.keys()
+        target = _ApplicationProgramTarget(
+            used_com_object_ref_ids=used_com_object_ref_ids,
+            used_module_arguments=used_module_arguments,
+            language_code=language_code,
         )
-        in_language = False
-        in_translation_ref: str | None = None  # TranslationElement RefId
-        # translation_map: {TranslationElement RefId: {AttributeName: Text}}
-        translation_map: dict[str, dict[str, str]] = {}
-
-        ns_language = f"{namespace}Language"
-        ns_translation_element = f"{namespace}TranslationElement"
-        ns_translation = f"{namespace}Translation"
-
-        for _, elem in tree_iterator:
-            if elem.tag == ns_language:
-                if in_language:
-                    # Hitting the next language tag after the one we were looking for.
-                    # We don't need anything after that tag (there isn't much anyway)
-                    elem.clear()
-                    break
-                in_language = elem.get("Identifier") == language_code
-            elif in_language and elem.tag == ns_translation_element:
-                ref_id = elem.get("RefId")
-                in_translation_ref = ref_id if ref_id in used_translation_ids else None
-            elif (
-                in_language
-                and in_translation_ref is not None
-                and elem.tag == ns_translation
-            ):
-                translation_map.setdefault(in_translation_ref, {})[
-                    elem.get("AttributeName")
-                ] = elem.get("Text")
-            elem.clear()
+        # the target receives start events only - no Element objects are created
+        parser = ElementTree.XMLParser(target=target)
+
+        zip_info = archive.getinfo(application_program_file)
+        try:
+            if zip_info.file_size <= _SINGLE_READ_MAX_SIZE:
+                # inflate the whole member at once and parse one contiguous buffer
+                parser.feed(archive.read(zip_info))
+            else:
+                with archive.open(zip_info, mode="r") as application_xml:
+                    while chunk := application_xml.read(_READ_CHUNK_SIZE):
+                        parser.feed(chunk)
+            parser.close()
+        except _ParsingDone:
+            pass
 
-        ApplicationProgramLoader.apply_translations(com_object_refs, translation_map)
-        ApplicationProgramLoader.apply_translations(com_objects, translation_map)
-        ApplicationProgramLoader.apply_translations(channels, translation_map)
+        ApplicationProgramLoader.apply_translations(
+            target.com_object_refs, target.translation_map
+        )
+        ApplicationProgramLoader.apply_translations(
+            target.com_objects, target.translation_map
+        )
+        ApplicationProgramLoader.apply_translations(
+            target.channels, target.translation_map
+        )
+        return ApplicationProgram(
+            com_objects=target.com_objects,
+            com_object_refs=target.com_object_refs,
+            allocators=target.allocators,
+            module_def_arguments=used_module_arguments,
+            numeric_args=target.numeric_args,
+            channels=target.channels,
+        )
 
     @staticmethod
     def parse_com_object(
-        elem: ElementTree.Element,
+        attrib: dict[str, str],
         identifier: str,
     ) -> ComObject:
         """Parse ComObject tag."""
+        get = attrib.get
         return ComObject(
             identifier=identifier,
-            name=elem.get("Name"),  # type: ignore[arg-type]
-            text=elem.get("Text"),  # type: ignore[arg-type]
-            number=int(elem.get("Number", 0)),
-            function_text=elem.get("FunctionText"),  # type: ignore[arg-type]
-            object_size=elem.get("ObjectSize"),  # type: ignore[arg-type]
-            read_flag=parse_xml_flag(elem.get("ReadFlag"), False),
-            write_flag=parse_xml_flag(elem.get("WriteFlag"), False),
-            communication_flag=parse_xml_flag(elem.get("CommunicationFlag"), False),
-            transmit_flag=parse_xml_flag(elem.get("TransmitFlag"), False),
-            update_flag=parse_xml_flag(elem.get("UpdateFlag"), False),
-            read_on_init_flag=parse_xml_flag(elem.get("ReadOnInitFlag"), False),
-            datapoint_types=parse_dpt_types(elem.get("DatapointType")),
-            base_number_argument_ref=elem.get("BaseNumber"),
+            name=get("Name"),  # type: ignore[arg-type]
+            text=get("Text"),  # type: ignore[arg-type]
+            number=int(get("Number", 0)),
+            function_text=intern_optional(get("FunctionText")),  # type: ignore[arg-type]
+            object_size=intern_optional(get("ObjectSize")),  # type: ignore[arg-type]
+            # missing ComObject flags default to False
+            read_flag=parse_xml_flag(get("ReadFlag"), False),
+            write_flag=parse_xml_flag(get("WriteFlag"), False),
+            communication_flag=parse_xml_flag(get("CommunicationFlag"), False),
+            transmit_flag=parse_xml_flag(get("TransmitFlag"), False),
+            update_flag=parse_xml_flag(get("UpdateFlag"), False),
+            read_on_init_flag=parse_xml_flag(get("ReadOnInitFlag"), False),
+            datapoint_types=parse_dpt_types(get("DatapointType")),
+            base_number_argument_ref=get("BaseNumber"),
         )
 
     @staticmethod
     def parse_com_object_ref(
-        elem: ElementTree.Element,
+        attrib: dict[str, str],
         identifier: str,
     ) -> ComObjectRef:
         """Parse ComObjectRef tag."""
+        get = attrib.get
         return ComObjectRef(
             identifier=identifier,
-            ref_id=elem.get("RefId"),  # type: ignore[arg-type]
-            name=elem.get("Name"),
-            text=elem.get("Text"),
-            function_text=elem.get("FunctionText"),
-            object_size=elem.get("ObjectSize"),
-            read_flag=parse_xml_flag(elem.get("ReadFlag")),
-            write_flag=parse_xml_flag(elem.get("WriteFlag")),
-            communication_flag=parse_xml_flag(elem.get("CommunicationFlag")),
-            transmit_flag=parse_xml_flag(elem.get("TransmitFlag")),
-            update_flag=parse_xml_flag(elem.get("UpdateFlag")),
-            read_on_init_flag=parse_xml_flag(elem.get("ReadOnInitFlag")),
-            datapoint_types=parse_dpt_types(elem.get("DatapointType")),
-            text_parameter_ref_id=elem.get("TextParameterRefId"),
+            ref_id=get("RefId"),  # type: ignore[arg-type]
+            name=get("Name"),
+            text=get("Text"),
+            function_text=intern_optional(get("FunctionText")),
+            object_size=intern_optional(get("ObjectSize")),
+            read_flag=parse_xml_flag(get("ReadFlag")),
+            write_flag=parse_xml_flag(get("WriteFlag")),
+            communication_flag=parse_xml_flag(get("CommunicationFlag")),
+            transmit_flag=parse_xml_flag(get("TransmitFlag")),
+            update_flag=parse_xml_flag(get("UpdateFlag")),
+            read_on_init_flag=parse_xml_flag(get("ReadOnInitFlag")),
+            datapoint_types=parse_dpt_types(get("DatapointType")),
+            text_parameter_ref_id=get("TextParameterRefId"),
         )
 
     @staticmethod
@@ -247,16 +167,16 @@ class ApplicationProgramLoader:
         translatable_object_map: dict[str, ComObject]
         | dict[str, ComObjectRef]
         | dict[str, ApplicationProgramChannel],
-        translation_map: dict[str, dict[str, str]],
+        translation_map: dict[str, _Translation],
     ) -> None:
         """Apply translations to Objects."""
         for identifier in translatable_object_map.keys() & translation_map.keys():
             translation = translation_map[identifier]
             obj = translatable_object_map[identifier]
-            if _text := translation.get("Text"):
+            if _text := translation.text:
                 obj.text = _text
             if hasattr(obj, "function_text") and (
-                _function_text := translation.get("FunctionText")
+                _function_text := translation.function_text
             ):
                 obj.function_text = _function_text
 
@@ -272,3 +192,163 @@ class ApplicationProgramLoader:
                 xml_file_name = device.application_program_xml()
                 result.setdefault(xml_file_name, []).append(device)
         return result
+
+
+class _ApplicationProgramTarget:
+    """Parser target collecting used items of an application program XML."""
+
+    def __init__(
+        self,
+        used_com_object_ref_ids: set[str],
+        used_module_arguments: dict[str, ModuleDefinitionArgumentInfo],
+        language_code: str | None,
+    ) -> None:
+        """Initialize the parser target."""
+        self.used_com_object_ref_ids = used_com_object_ref_ids
+        self.used_module_arguments = used_module_arguments
+        self.language_code = language_code
+
+        self.com_object_refs: dict[str, ComObjectRef] = {}  # {Id: ComObjectRef}
+        self.com_objects: dict[str, ComObject] = {}  # {Id: ComObject}
+        self.numeric_args: dict[str, ModuleDefinitionNumericArg] = {}
+        self.channels: dict[
+            str, ApplicationProgramChannel
+        ] = {}  # {Id: ApplicationProgramChannel}
+        self.allocators: dict[str, Allocator] = {}
+        # translation_map: {TranslationElement RefId: _Translation}
+        self.translation_map: dict[str, _Translation] = {}
+
+        self._namespace: str | None = None
+        # {namespaced tag: handler} - replaced when reaching the Languages section
+        self._handlers: dict[str, Callable[[dict[str, str]], None]] = {}
+        self._in_language = False
+        # translation of the current TranslationElement if it is used
+        self._current_translation: _Translation | None = None
+        self._used_translation_ids: set[str] = set()
+
+    def _start_root(self, tag: str) -> None:
+        """Build the handler table from the namespace of the root element."""
+        # root tag is "{<namespace uri>}KNX"
+        self._namespace = tag[: tag.rfind("}") + 1]
+        # namespaced tag strings for exact hash lookup
+        # ~15% faster than tag.endswith("tagname") or tag == f"{namespace}tagname"
+        self._handlers = {
+            f"{self._namespace}ComObject": self._com_object,
+            f"{self._namespace}ComObjectRef": self._com_object_ref,
+            f"{self._namespace}Allocator": self._allocator,
+            f"{self._namespace}Argument": self._argument,
+            f"{self._namespace}NumericArg": self._numeric_arg,
+            f"{self._namespace}Channel": self._channel,
+            f"{self._namespace}Languages": self._languages,
+        }
+
+    def start(self, tag: str, attrib: dict[str, str]) -> None:
+        """Handle an element start event."""
+        if (handler := self._handlers.get(tag)) is not None:
+            handler(attrib)
+        elif self._namespace is None:
+            self._start_root(tag)
+
+    def _com_object(self, attrib: dict[str, str]) -> None:
+        """Handle ComObject tag."""
+        # we take all since we don't know which are referenced to yet
+        identifier = attrib["Id"]
+        self.com_objects[identifier] = ApplicationProgramLoader.parse_com_object(
+            attrib, identifier
+        )
+
+    def _com_object_ref(self, attrib: dict[str, str]) -> None:
+        """Handle ComObjectRef tag."""
+        if (_id := attrib["Id"]) in self.used_com_object_ref_ids:
+            self.com_object_refs[_id] = ApplicationProgramLoader.parse_com_object_ref(
+                attrib, _id
+            )
+
+    def _allocator(self, attrib: dict[str, str]) -> None:
+        """Handle Allocators/Allocator tag."""
+        _id = attrib["Id"]
+        self.allocators[_id] = Allocator(
+            identifier=_id,
+            name=attrib.get("Name"),  # type: ignore[arg-type]
+            start=int(attrib["Start"]),
+            end=int(attrib["maxInclusive"]),
+        )
+
+    def _argument(self, attrib: dict[str, str]) -> None:
+        """Handle Argument tag."""
+        # ModuleDefs/ModuleDef/Arguments/
+        # or ModuleDefs/ModuleDef/SubModuleDefs/ModuleDef/Arguments/
+        if (_id := attrib["Id"]) in self.used_module_arguments:
+            allocates = attrib.get("Allocates")
+            self.used_module_arguments[_id] = ModuleDefinitionArgumentInfo(
+                name=attrib.get("Name"),  # type: ignore[arg-type]
+                allocates=int(allocates) if allocates is not None else None,
+            )
+
+    def _numeric_arg(self, attrib: dict[str, str]) -> None:
+        """Handle NumericArg tag."""
+        # in dynamic section of Modules
+        if (_id := attrib.get("RefId")) in self.used_module_arguments:
+            value = attrib.get("Value")
+            self.numeric_args[_id] = ModuleDefinitionNumericArg(
+                allocator_ref_id=attrib.get("AllocatorRefId"),
+                base_value=attrib.get("BaseValue"),
+                value=int(value) if value is not None else None,
+            )
+
+    def _channel(self, attrib: dict[str, str]) -> None:
+        """Handle Channel tag."""
+        _id = attrib["Id"]
+        self.channels[_id] = ApplicationProgramChannel(
+            identifier=_id,
+            name=attrib.get("Name"),  # type: ignore[arg-type]
+            number=attrib.get("Number"),  # type: ignore[arg-type]
+            text=attrib.get("Text"),
+            text_parameter_ref_id=attrib.get("TextParameterRefId"),
+        )
+
+    def _languages(self, attrib: dict[str, str]) -> None:
+        """Handle Languages tag. Only translations follow."""
+        if self.language_code is None:
+            raise _ParsingDone
+        # only translations of used items are stored
+        self._used_translation_ids = (
+            {com_object_ref.ref_id for com_object_ref in self.com_object_refs.values()}
+            | self.used_com_object_ref_ids
+            | self.channels.keys()
+        )
+        self._handlers = {
+            f"{self._namespace}Language": self._language,
+            f"{self._namespace}TranslationElement": self._translation_element,
+            f"{self._namespace}Translation": self._translation,
+        }
+
+    def _language(self, attrib: dict[str, str]) -> None:
+        """Handle Language tag."""
+        if self._in_language:
+            # Hitting the next language tag after the one we were looking for.
+            # We don't need anything after that tag (there isn't much anyway)
+            raise _ParsingDone
+        self._in_language = attrib.get("Identifier") == self.language_code
+
+    def _translation_element(self, attrib: dict[str, str]) -> None:
+        """Handle TranslationElement tag."""
+        if not self._in_language:
+            return
+        if (ref_id := attrib.get("RefId")) not in self._used_translation_ids:
+            self._current_translation = None
+            return
+        if (translation := self.translation_map.get(ref_id)) is None:
+            translation = self.translation_map[ref_id] = _Translation(
+                text=None, function_text=None
+            )
+        self._current_translation = translation
+
+    def _translation(self, attrib: dict[str, str]) -> None:
+        """Handle Translation tag."""
+        if self._in_language and self._current_translation is not None:
+            attribute_name = attrib.get("AttributeName")
+            if attribute_name == "Text":
+                self._current_translation.text = attrib.get("Text")
+            elif attribute_name == "FunctionText":
+                self._current_translation.function_text = attrib.get("Text")
@@ -2,13 +2,20 @@
 
 from __future__ import annotations
 
+from collections.abc import Callable
+import re
 from xml.etree import ElementTree
-from zipfile import Path
+from zipfile import Path, ZipFile
 
 from xknxproject.models import HardwareToPrograms, Product
+from xknxproject.util import intern_optional
 from xknxproject.zip import KNXProjContents
 
 
+class _ParsingDone(Exception):
+    """Raised by the parser target when no further elements are needed."""
+
+
 class HardwareLoader:
     """Load hardware from KNX XML."""
 
@@ -18,34 +25,58 @@ class HardwareLoader:
         language_code: str | None,
     ) -> tuple[dict[str, Product], HardwareToPrograms]:
         """Load Hardware mappings."""
-        product_dict: dict[str, Product] = {}
-        hardware_programs: HardwareToPrograms = {}
+        return HardwareLoader.load_from_archive(
+            archive=hardware_file.root,
+            hardware_file=hardware_file.at,
+            language_code=language_code,
+        )
+
+    @staticmethod
+    def load_from_archive(
+        archive: ZipFile,
+        hardware_file: str,
+        language_code: str | None,
+    ) -> tuple[dict[str, Product], HardwareToPrograms]:
+        """Load Hardware mappings from a member of the project archive."""
+        # inflate the member in one go instead of many small reads while parsing
+        hardware_data = archive.read(hardware_file)
+        if language_code and not re.search(
+            rb"""Identifier\s*=\s*["']%s["']""" % re.escape(language_code.encode()),
+            hardware_data,
+        ):
+            # this manufacturer has no translations for the requested language
+            language_code = None
 
-        with hardware_file.open(mode="rb") as hardware_xml:
-            tree = ElementTree.parse(hardware_xml)
-            for hardware_node in tree.findall(
-                ".//{*}Manufacturer/{*}Hardware/{*}Hardware"
-            ):
-                _products, _hardware_programs = HardwareLoader.parse_hardware_element(
-                    hardware_node
-                )
-                product_dict |= _products
-                hardware_programs |= _hardware_programs
-
-            if language_code:
-                for translation_element in tree.findall(
-                    ".//{*}Manufacturer/{*}Languages"
-                    f"/{{*}}Language[@Identifier='{language_code}']"
-                    "/{*}TranslationUnit/{*}TranslationElement"
-                ):
-                    _ref_id = translation_element.get("RefId")
-                    if _ref_id not in product_dict:
-                        continue
-                    HardwareLoader.apply_product_translation(
-                        product_dict[_ref_id], translation_element
-                    )
+        target = _HardwareTarget(language_code=language_code)
+        # the target receives start events only - no Element objects are created
+        parser = ElementTree.XMLParser(target=target)
+        try:
+            parser.feed(hardware_data)
+            parser.close()
+        except _ParsingDone:
+            pass
 
-        return product_dict, hardware_programs
+        return target.products, target.hardware_programs
+
+    @staticmethod
+    def get_hardware_files(project_contents: KNXProjContents) -> list[Path]:
+        """Get all manufactures Hardware.xml in given KNX ZIP file."""
+        return [
+            project_contents.root_path / name
+            for name in HardwareLoader.get_hardware_file_names(project_contents)
+        ]
+
+    @staticmethod
+    def get_hardware_file_names(project_contents: KNXProjContents) -> list[str]:
+        """Get member names of all manufactures Hardware.xml in given KNX ZIP file."""
+        # M-*/Hardware.xml - single pass over member names instead of Path lookups
+        return [
+            name
+            for name in project_contents.root.namelist()
+            if name.startswith("M-")
+            and name.endswith("/Hardware.xml")
+            and name.count("/") == 1
+        ]
 
     @staticmethod
     def parse_hardware_element(
@@ -106,17 +137,101 @@ class HardwareLoader:
 
         return identifier, application_ref
 
-    @staticmethod
-    def get_hardware_files(project_contents: KNXProjContents) -> list[Path]:
-        """Get all manufactures Hardware.xml in given KNX ZIP file."""
-        # M-*/Hardware.xml
-        manufacturer_dirs = [
-            child
-            for child in project_contents.root_path.iterdir()
-            if child.is_dir() and child.name.startswith("M-")
-        ]
-        return [
-            xml_file
-            for manufacturer in manufacturer_dirs
-            if (xml_file := (manufacturer / "Hardware.xml")).exists()
-        ]
+
+class _HardwareTarget:
+    """Parser target collecting products and hardware programs of a Hardware XML."""
+
+    def __init__(self, language_code: str | None) -> None:
+        """Initialize the parser target."""
+        self.language_code = language_code
+
+        self.products: dict[str, Product] = {}  # {Id: Product}
+        self.hardware_programs: HardwareToPrograms = {}
+
+        self._namespace: str | None = None
+        # {namespaced tag: handler} - replaced when reaching the Languages section
+        self._handlers: dict[str, Callable[[dict[str, str]], None]] = {}
+        self._hardware_name = ""
+        # Id of the current Hardware2Program until its ApplicationProgramRef is found
+        self._hardware2program_id: str | None = None
+        self._in_language = False
+        # product of the current TranslationElement until its Text is found
+        self._current_product: Product | None = None
+
+    def _start_root(self, tag: str) -> None:
+        """Build the handler table from the namespace of the root element."""
+        # root tag is "{<namespace uri>}KNX"
+        self._namespace = tag[: tag.rfind("}") + 1]
+        self._handlers = {
+            f"{self._namespace}Hardware": self._hardware,
+            f"{self._namespace}Product": self._product,
+            f"{self._namespace}Hardware2Program": self._hardware2program,
+            f"{self._namespace}ApplicationProgramRef": self._application_program_ref,
+            f"{self._namespace}Languages": self._languages,
+        }
+
+    def start(self, tag: str, attrib: dict[str, str]) -> None:
+        """Handle an element start event."""
+        if (handler := self._handlers.get(tag)) is not None:
+            handler(attrib)
+        elif self._namespace is None:
+            self._start_root(tag)
+
+    def _hardware(self, attrib: dict[str, str]) -> None:
+        """Handle Hardware tag."""
+        # the outer Manufacturer/Hardware container has no Name
+        self._hardware_name = attrib.get("Name", "")
+
+    def _product(self, attrib: dict[str, str]) -> None:
+        """Handle Products/Product tag."""
+        identifier = intern_optional(attrib.get("Id", ""))
+        # positional arguments - this is called for every product of the catalog
+        self.products[identifier] = Product(
+            identifier,
+            attrib.get("Text", ""),
+            attrib.get("OrderNumber", ""),
+            self._hardware_name,
+        )
+
+    def _hardware2program(self, attrib: dict[str, str]) -> None:
+        """Handle Hardware2Programs/Hardware2Program tag."""
+        self._hardware2program_id = attrib.get("Id")
+
+    def _application_program_ref(self, attrib: dict[str, str]) -> None:
+        """Handle Hardware2Program/ApplicationProgramRef tag."""
+        if self._hardware2program_id is None:
+            return
+        if (application_ref := attrib.get("RefId")) is not None:
+            self.hardware_programs[intern_optional(self._hardware2program_id)] = (
+                intern_optional(application_ref)
+            )
+        # only the first ApplicationProgramRef is used
+        self._hardware2program_id = None
+
+    def _languages(self, attrib: dict[str, str]) -> None:
+        """Handle Languages tag. Only translations follow."""
+        if not self.language_code:
+            raise _ParsingDone
+        self._handlers = {
+            f"{self._namespace}Language": self._language,
+            f"{self._namespace}TranslationElement": self._translation_element,
+            f"{self._namespace}Translation": self._translation,
+        }
+
+    def _language(self, attrib: dict[str, str]) -> None:
+        """Handle Language tag."""
+        if self._in_language:
+            # other languages of this manufacturer are not of interest
+            raise _ParsingDone
+        self._in_language = attrib.get("Identifier") == self.language_code
+
+    def _translation_element(self, attrib: dict[str, str]) -> None:
+        """Handle TranslationElement tag."""
+        if self._in_language:
+            self._current_product = self.products.get(attrib.get("RefId", ""))
+
+    def _translation(self, attrib: dict[str, str]) -> None:
+        """Handle Translation tag."""
+        if self._current_product is not None and attrib.get("AttributeName") == "Text":
+            self._current_product.text = attrib.get("Text", "")
+            self._current_product = None
@@ -2,12 +2,14 @@
 
 from __future__ import annotations
 
+from io import BytesIO
 import logging
 from xml.etree import ElementTree
 from zipfile import Path
 
 from xknxproject.const import ETS4_PRODUCT_LANGUAGES
 from xknxproject.models import KNXMasterData, TranslationsType
+from xknxproject.util import intern_optional
 from xknxproject.zip import KNXProjContents
 
 _LOGGER = logging.getLogger("xknxproject.log")
@@ -30,31 +32,47 @@ class KNXMasterLoader:
         translations: TranslationsType = {}
         function_type_mapping: dict[str, str] = {}
 
-        with knx_master_file.open(mode="rb") as master_xml:
-            tree = ElementTree.parse(master_xml)
-            for manufacturer in tree.findall(".//{*}Manufacturers/{*}Manufacturer"):
-                identifier = manufacturer.get("Id", "")
-                manufacturer_mapping[identifier] = manufacturer.get("Name", "")
+        # inflate the member in one go instead of many small reads while parsing
+        with BytesIO(knx_master_file.read_bytes()) as master_xml:
+            tree_iterator = ElementTree.iterparse(master_xml, events=("start", "end"))
+            # resolve the namespace once to compare exact tags
+            _, root = next(tree_iterator)
+            namespace = root.tag.split("KNX", maxsplit=1)[0]
+            ns_manufacturer = f"{namespace}Manufacturer"
+            ns_space_usage = f"{namespace}SpaceUsage"
+            ns_function_type = f"{namespace}FunctionType"
+            ns_language = f"{namespace}Language"
+            ns_languages = f"{namespace}Languages"
+            ns_translation_element = f"{namespace}TranslationElement"
+            ns_translation = f"{namespace}Translation"
+
+            # attributes are read on start events so elements can be cleared on end
+            for event, elem in tree_iterator:
+                if event == "end":
+                    elem.clear()
+                    continue
+                tag = elem.tag
+                if tag == ns_manufacturer:
+                    identifier = intern_optional(elem.get("Id", ""))
+                    manufacturer_mapping[identifier] = elem.get("Name", "")
+                elif tag == ns_space_usage:
+                    identifier = intern_optional(elem.get("Id", ""))
+                    space_usage_mapping[identifier] = elem.get("Text", "")
+                elif tag == ns_function_type:
+                    identifier = elem.get("Id", "")
+                    function_type_mapping[identifier] = elem.get("Text", "")
+                elif tag == ns_language:
+                    # ProductLanguages/Language - only used to find the language code
+                    if language is not None:
+                        product_languages.append(elem.get("Identifier", ""))
+                elif tag == ns_languages:
+                    # translations follow - all ProductLanguages are known by now
+                    break
 
             if knx_proj_contents.is_ets4_project():
                 # No SpaceUsage in ETS4, neither ProductLanguages. Therefore, we use an
                 # hardcoded list of common product languages
                 product_languages = ETS4_PRODUCT_LANGUAGES
-            else:
-                for space_usage_node in tree.findall(".//{*}SpaceUsages/{*}SpaceUsage"):
-                    identifier = space_usage_node.get("Id", "")
-                    space_usage_mapping[identifier] = space_usage_node.get("Text", "")
-
-                for language_node in tree.findall(".//{*}ProductLanguages/{*}Language"):
-                    product_languages.append(language_node.get("Identifier", ""))
-
-                for function_type_node in tree.findall(
-                    ".//{*}FunctionTypes/{*}FunctionType"
-                ):
-                    identifier = function_type_node.get("Id", "")
-                    function_type_mapping[identifier] = function_type_node.get(
-                        "Text", ""
-                    )
 
             if language is not None:
                 language_code = KNXMasterLoader.get_language_code(
@@ -62,18 +80,24 @@ class KNXMasterLoader:
                 )
 
             if language_code:
-                for translation_element in tree.findall(
-                    ".//{*}Languages"
-                    f"/{{*}}Language[@Identifier='{language_code}']"
-                    "/{*}TranslationUnit/{*}TranslationElement"
-                ):
-                    _ref_id = translation_element.get("RefId", "")
-                    translations[_ref_id] = {
-                        attr: text
-                        for item in translation_element.findall("{*}Translation")
-                        if (attr := item.get("AttributeName")) is not None
-                        and (text := item.get("Text")) is not None
-                    }
+                in_language = False
+                translation: dict[str, str] = {}
+                for event, elem in tree_iterator:
+                    if event == "start":
+                        if elem.tag == ns_language:
+                            in_language = elem.get("Identifier") == language_code
+                        elif in_language and elem.tag == ns_translation_element:
+                            translation = translations[elem.get("RefId", "")] = {}
+                        continue
+                    if in_language:
+                        if elem.tag == ns_translation:
+                            if (attr := elem.get("AttributeName")) is not None and (
+                                text := elem.get("Text")
+                            ) is not None:
+                                translation[attr] = text
+                        elif elem.tag == ns_language:
+                            break
+                    elem.clear()
 
         return (
             KNXMasterData(
@@ -91,11 +115,9 @@ class KNXMasterLoader:
         if language in product_languages:
             return language
 
-        for language_code, country_code in [
-            _lan.split("-", maxsplit=1) for _lan in product_languages
-        ]:
-            if language[:2].lower() == language_code:
-                used_language = f"{language_code}-{country_code}"
+        requested_code = language[:2].lower()
+        for used_language in product_languages:
+            if used_language.partition("-")[0] == requested_code:
                 _LOGGER.info(
                     'Using language code "%s" for "%s"', used_language, language
                 )
@@ -2,7 +2,8 @@
 
 from __future__ import annotations
 
-import re
+from collections.abc import Callable
+from itertools import chain
 from xml.etree import ElementTree
 
 from xknxproject.exceptions import UnexpectedDataError
@@ -25,9 +26,25 @@ from xknxproject.models import (
     XMLProjectInformation,
     XMLSpace,
 )
-from xknxproject.util import get_dpt_type, parse_dpt_types, parse_xml_flag
+from xknxproject.util import get_dpt_type, intern_optional, parse_dpt_types
 from xknxproject.zip import KNXProjContents
 
+# knx:Enable_t values of ComObjectInstanceRef flags - missing flags are None,
+# unknown values are False (see parse_xml_flag)
+_XML_FLAGS: dict[str | None, bool | None] = {
+    None: None,
+    "Enabled": True,
+    "Disabled": False,
+}
+# ComObjectInstanceRef attributes not overriding any ComObject(Ref) value
+_COM_OBJECT_INSTANCE_REF_BASE_ATTRIBUTES = frozenset(
+    ("Id", "IsActive", "Links", "RefId")
+)
+# {Type attribute: SpaceType} - avoids Enum lookup for every space
+_SPACE_TYPES: dict[str | None, SpaceType] = {
+    space_type.value: space_type for space_type in SpaceType
+}
+
 
 class ProjectLoader:
     """Load Project file."""
@@ -54,57 +71,103 @@ class ProjectLoader:
         functions: list[XMLFunction] = []
 
         with knx_proj_contents.open_project_meta() as project_file:
-            tree = ElementTree.parse(project_file)
-            project_info = load_project_info(tree)
+            # ProjectInformation sits at the top of the file - stop parsing
+            # once its start tag (holding all needed attributes) is reached
+            meta_root: ElementTree.Element | None = None
+            for _, elem in ElementTree.iterparse(project_file, events=("start",)):
+                if meta_root is None:
+                    meta_root = elem
+                if elem.tag.endswith("}ProjectInformation"):
+                    break
+            if meta_root is None:
+                raise UnexpectedDataError("Project meta file has no root element")
+            project_info = load_project_info(meta_root)
+
+        # ETS4 has a different naming for locations than ETS5/6
+        element_name = (
+            "Buildings" if knx_proj_contents.is_ets4_project() else "Locations"
+        )
+        devices_by_id: dict[str, str] = {}
 
         with knx_proj_contents.open_project_0() as project_0_file:
-            tree = ElementTree.parse(project_0_file)
-            for ga_element in tree.findall(
-                # `//` to ignore <GroupRange> tags to support different GA level formats
-                "{*}Project/{*}Installations/{*}Installation/{*}GroupAddresses//{*}GroupAddress"
-            ):
-                group_address_list.append(
-                    _GroupAddressLoader.load(
-                        group_address_element=ga_element,
-                        group_address_style=project_info.group_address_style,
-                    ),
-                )
-            for ga_range_l1 in tree.findall(
-                "{*}Project/{*}Installations/{*}Installation/{*}GroupAddresses/{*}GroupRanges/{*}GroupRange"
-            ):
-                group_range_list.append(
-                    _GroupAddressRangeLoader.load(
-                        ga_range_l1, project_info.group_address_style
-                    )
+            # start events are used to open Areas and Lines so every device can be
+            # processed and cleared on its own end event - keeps peak memory low
+            tree_iterator = ElementTree.iterparse(
+                project_0_file, events=("start", "end")
+            )
+            # every element tag carries the namespace - take it from the root
+            first_event = next(tree_iterator)
+            root_tag = first_event[1].tag
+            if not root_tag.startswith("{"):
+                raise UnexpectedDataError(
+                    f"Project file root element '{root_tag}' has no namespace"
                 )
-            topology_loader = _TopologyLoader(knx_proj_contents)
-            for topology_element in tree.findall(
-                "{*}Project/{*}Installations/{*}Installation/{*}Topology"
-            ):
-                areas.extend(topology_loader.load(topology_element=topology_element))
-            for area in areas:
-                for line in area.lines:
-                    devices.extend(line.devices)
-
-            # ETS4 has a different naming for locations than ETS5/6
-            element_name = (
-                "Buildings" if knx_proj_contents.is_ets4_project() else "Locations"
+            namespace = root_tag.partition("}")[0] + "}"
+            ns_area = f"{namespace}Area"
+            ns_line = f"{namespace}Line"
+            ns_segment = f"{namespace}Segment"
+            ns_device_instance = f"{namespace}DeviceInstance"
+            ns_locations = f"{namespace}{element_name}"
+            ns_group_addresses = f"{namespace}GroupAddresses"
+            # concrete-namespace paths - compiled once and cached by ElementPath
+            # `//` to ignore <GroupRange> tags to support all GA level formats
+            group_address_path = f".//{namespace}GroupAddress"
+            group_range_path = f"{namespace}GroupRanges/{namespace}GroupRange"
+            # unused Installation subtrees - dropped as soon as they end
+            ns_discarded = {
+                ns_area,
+                ns_segment,
+                f"{namespace}Topology",
+                f"{namespace}Trades",
+            }
+            topology_loader = _TopologyLoader(
+                knx_proj_contents, namespace, devices, devices_by_id
             )
 
-            location_loader = _LocationLoader(
-                knx_proj_contents,
-                knx_master_data,
-                devices,
-            )
-            for location_element in tree.findall(
-                f"{{*}}Project/{{*}}Installations/{{*}}Installation/{{*}}{element_name}"
-            ):
-                spaces.extend(
-                    location_loader.load(
-                        location_element=location_element, functions=functions
+            # subtrees of interest are processed and cleared as soon as they end
+            for event, elem in chain((first_event,), tree_iterator):
+                tag = elem.tag
+                if event == "start":
+                    if tag == ns_area:
+                        areas.append(topology_loader.start_area(elem))
+                    elif tag == ns_line:
+                        topology_loader.start_line(elem)
+                    elif tag == ns_segment:
+                        topology_loader.start_segment(elem)
+                    continue
+
+                if tag == ns_device_instance:
+                    # devices are collected by the loader
+                    topology_loader.end_device(elem)
+                elif tag == ns_line:
+                    topology_loader.end_line()
+                elif tag == ns_locations:
+                    # Topology precedes Locations in the XSD so all devices are known
+                    location_loader = _LocationLoader(
+                        knx_proj_contents,
+                        knx_master_data,
+                        namespace,
+                        devices_by_id,
                     )
-                )
+                    spaces.extend(
+                        location_loader.load(location_element=elem, functions=functions)
+                    )
+                elif tag == ns_group_addresses:
+                    group_address_style = project_info.group_address_style
+                    load_group_address = _GroupAddressLoader.load
+                    group_address_list.extend(
+                        load_group_address(ga_element, group_address_style)
+                        for ga_element in elem.iterfind(group_address_path)
+                    )
+                    group_range_list.extend(
+                        _GroupAddressRangeLoader.load(ga_range_l1, group_address_style)
+                        for ga_range_l1 in elem.iterfind(group_range_path)
+                    )
+                elif tag not in ns_discarded:
+                    continue
+                elem.clear()
 
+        group_address_by_id = {ga.identifier: ga.address for ga in group_address_list}
         for function in functions:
             function.usage_text = (
                 knx_master_data.get_function_type_name(function.function_type)
@@ -114,12 +177,8 @@ class ProjectLoader:
 
             for group_address in function.group_addresses:
                 try:
-                    group_address.address = next(
-                        ga.address
-                        for ga in group_address_list
-                        if ga.identifier == group_address.ref_id
-                    )
-                except StopIteration:
+                    group_address.address = group_address_by_id[group_address.ref_id]
+                except KeyError:
                     raise UnexpectedDataError(
                         f"Group address {group_address.ref_id} referred in function not found"
                     ) from None
@@ -144,16 +203,17 @@ class _GroupAddressLoader:
         group_address_style: GroupAddressStyle,
     ) -> XMLGroupAddress:
         """Load GroupAddress mappings."""
-        project_uid = group_address_element.get("Puid")
+        get = group_address_element.attrib.get
+        project_uid = get("Puid")
         return XMLGroupAddress(
-            name=group_address_element.get("Name", ""),
-            identifier=group_address_element.get("Id", ""),
-            address=group_address_element.get("Address", ""),
+            name=get("Name", ""),
+            identifier=get("Id", ""),
+            address=get("Address", ""),
             project_uid=int(project_uid) if project_uid else None,
-            description=group_address_element.get("Description", ""),
-            dpt=get_dpt_type(group_address_element.get("DatapointType")),
-            data_secure_key=group_address_element.get("Key"),
-            comment=group_address_element.get("Comment", ""),
+            description=get("Description", ""),
+            dpt=get_dpt_type(get("DatapointType")),
+            data_secure_key=get("Key"),
+            comment=get("Comment", ""),
             style=group_address_style,
         )
 
@@ -167,21 +227,29 @@ class _GroupAddressRangeLoader:
     ) -> XMLGroupRange:
         """Load GroupRange."""
 
-        def create_xml_group_range(elem: ElementTree.Element) -> XMLGroupRange:
-            group_range_elems = elem.findall("./{*}GroupRange")
-            group_ranges = [
-                create_xml_group_range(range_elem) for range_elem in group_range_elems
-            ]
+        # all child tags share the namespace of the GroupRange element
+        namespace = group_range_element.tag.rpartition("}")[0] + "}"
+        tag_group_address = f"{namespace}GroupAddress"
+        tag_group_range = f"{namespace}GroupRange"
 
+        def create_xml_group_range(elem: ElementTree.Element) -> XMLGroupRange:
+            group_ranges: list[XMLGroupRange] = []
+            group_addresses: list[int] = []
+            # single pass over children instead of two wildcard findall calls
+            for child in elem:
+                if child.tag == tag_group_address:
+                    group_addresses.append(int(child.attrib["Address"]))
+                elif child.tag == tag_group_range:
+                    group_ranges.append(create_xml_group_range(child))
+
+            get = elem.attrib.get
             return XMLGroupRange(
-                name=elem.get("Name", ""),
-                range_start=int(elem.get("RangeStart")),  # type: ignore[arg-type]
-                range_end=int(elem.get("RangeEnd")),  # type: ignore[arg-type]
-                group_addresses=[
-                    int(e.attrib["Address"]) for e in elem.findall("{*}GroupAddress")
-                ],
+                name=get("Name", ""),
+                range_start=int(get("RangeStart")),  # type: ignore[arg-type]
+                range_end=int(get("RangeEnd")),  # type: ignore[arg-type]
+                group_addresses=group_addresses,
                 group_ranges=group_ranges,
-                comment=elem.get("Comment", ""),
+                comment=get("Comment", ""),
                 style=group_address_style,
             )
 
@@ -191,92 +259,170 @@ class _GroupAddressRangeLoader:
 class _TopologyLoader:
     """Load topology from KNX XML."""
 
-    def __init__(self, knx_proj_contents: KNXProjContents) -> None:
-        self.__knx_proj_contents = knx_proj_contents
-
-    def load(self, topology_element: ElementTree.Element) -> list[XMLArea]:
-        """Load topology mappings."""
-        areas: list[XMLArea] = []
-
-        for area in topology_element.findall("{*}Area"):
-            areas.append(self._create_area(area))
-
-        return areas
-
-    def _create_area(self, area_element: ElementTree.Element) -> XMLArea:
-        """Create an Area."""
-        address: int = int(area_element.get("Address", ""))
-        name: str = area_element.get("Name", "")
-        description: str | None = area_element.get("Description")
-        area: XMLArea = XMLArea(address, name, description, [])
-
-        for line_element in area_element:
-            area.lines.append(self._create_line(line_element, area))
-
-        return area
+    def __init__(
+        self,
+        knx_proj_contents: KNXProjContents,
+        namespace: str,
+        devices: list[DeviceInstance],
+        devices_by_id: dict[str, str],
+    ) -> None:
+        # "{<namespace uri>}" of the project file - compare tags with literals
+        self._tag_node = f"{namespace}Node"
+        self._path_connectors = f"{namespace}Connectors"
+        self._path_send = f"{namespace}Send"
+        self._path_receive = f"{namespace}Receive"
+        self._path_module_arguments = f"{namespace}Arguments/{namespace}Argument"
+        self._device_child_handlers: dict[
+            str, Callable[[DeviceInstance, ElementTree.Element], None]
+        ] = {
+            f"{namespace}ComObjectInstanceRefs": self._parse_com_object_instance_refs,
+            f"{namespace}ParameterInstanceRefs": self._parse_parameter_instance_refs,
+            f"{namespace}GroupObjectTree": self._parse_group_object_tree,
+            f"{namespace}ModuleInstances": self._parse_module_instances,
+            f"{namespace}AdditionalAddresses": self._parse_additional_addresses,
+        }
+        # filled with every created device - {Id: individual_address}
+        self._devices = devices
+        self._devices_by_id = devices_by_id
+        # {ProductRefId: manufacturer} - many devices share the same product
+        self._manufacturers: dict[str, str] = {}
+        # Area and Line currently open in the streamed document
+        self._area: XMLArea | None = None
+        self._line: XMLLine | None = None
+        self._line_has_segment = False
+        # the project schema is fixed for a load - pick the links parser once
+        self._get_links: Callable[[ElementTree.Element], list[str]] = (
+            self.__get_links_from_ets4
+            if knx_proj_contents.is_ets4_project()
+            else self.__get_links_from_ets5
+        )
 
-    def _create_line(self, line_element: ElementTree.Element, area: XMLArea) -> XMLLine:
-        """Create a Line."""
-        address: int = int(line_element.get("Address", ""))
-        name: str = line_element.get("Name", "")
-        description: str | None = line_element.get("Description")
-        if (segment := line_element.find("{*}Segment")) is not None:
-            #  ETS-6 (21) adds "Segment" tags between "Line" and "DeviceInstance" tags
-            medium_type = segment.get("MediumTypeRefId", "")
-        else:
-            medium_type = line_element.get("MediumTypeRefId", "")
-        line: XMLLine = XMLLine(address, description, name, medium_type, [], area)
+    def start_area(self, area_element: ElementTree.Element) -> XMLArea:
+        """Create an Area from its start tag - Lines are added while parsing."""
+        attrib = area_element.attrib
+        get = attrib.get
+        self._area = XMLArea(
+            address=int(attrib["Address"]),  # required
+            name=get("Name", ""),
+            description=get("Description"),
+            lines=[],
+        )
+        return self._area
+
+    def start_line(self, line_element: ElementTree.Element) -> None:
+        """Create a Line of the current Area from its start tag."""
+        attrib = line_element.attrib
+        get = attrib.get
+        self._line = XMLLine(
+            address=int(attrib["Address"]),  # required
+            description=get("Description"),
+            name=get("Name", ""),
+            medium_type=intern_optional(get("MediumTypeRefId", "")),
+            devices=[],
+            area=self._area,  # type: ignore[arg-type]
+        )
+        self._area.lines.append(self._line)  # type: ignore[union-attr]
+        self._line_has_segment = False
+
+    def start_segment(self, segment_element: ElementTree.Element) -> None:
+        """Apply the medium type of the first Segment to the current Line."""
+        #  ETS-6 (21) adds "Segment" tags between "Line" and "DeviceInstance" tags
+        if self._line is not None and not self._line_has_segment:
+            self._line.medium_type = intern_optional(
+                segment_element.get("MediumTypeRefId", "")
+            )
+            self._line_has_segment = True
 
-        for device_element in line_element.findall(".//{*}DeviceInstance"):
-            if device := self._create_device(device_element, line):
-                line.devices.append(device)
+    def end_line(self) -> None:
+        """Close the current Line."""
+        self._line = None
 
-        return line
+    def end_device(self, device_element: ElementTree.Element) -> None:
+        """Create a device of the current Line from its completely parsed element."""
+        if self._line is None:
+            # not part of a Line - eg. unassigned devices
+            return
+        if device := self._create_device(device_element, self._line):
+            self._line.devices.append(device)
 
     def _create_device(
         self, device_element: ElementTree.Element, line: XMLLine
     ) -> DeviceInstance | None:
         """Create device."""
-        address: str | None = device_element.get("Address")
+        get = device_element.attrib.get
+        address: str | None = get("Address")
         #  devices like power supplies do usually not have an IA.
         if address is None:
             return None
 
-        project_uid = device_element.get("Puid")
-        product_ref = device_element.get("ProductRefId", "")
-
-        additional_addresses = [
-            add_addr
-            for address_elem in device_element.findall(
-                "{*}AdditionalAddresses/{*}Address"
+        project_uid = get("Puid")
+        product_ref = intern_optional(get("ProductRefId", ""))
+        if (manufacturer := self._manufacturers.get(product_ref)) is None:
+            manufacturer = self._manufacturers[product_ref] = intern_optional(
+                product_ref.partition("_")[0]
             )
-            if (add_addr := address_elem.get("Address")) is not None
-        ]
 
-        com_obj_inst_refs = [
+        device = DeviceInstance(
+            identifier=get("Id", ""),
+            address=int(address),
+            project_uid=int(project_uid) if project_uid else None,
+            name=get("Name", ""),
+            description=get("Description", ""),
+            last_modified=get("LastModified", ""),
+            product_ref=product_ref,
+            hardware_program_ref=intern_optional(get("Hardware2ProgramRefId", "")),
+            line=line,
+            manufacturer=manufacturer,
+            additional_addresses=[],
+            channels=[],
+            com_object_instance_refs=[],
+            module_instances=[],
+            parameter_instance_refs={},
+        )
+        # single pass over the device children dispatching on the full tag
+        handlers = self._device_child_handlers
+        for child in device_element:
+            if (handler := handlers.get(child.tag)) is not None:
+                handler(device, child)
+
+        self._devices.append(device)
+        self._devices_by_id[device.identifier] = device.individual_address
+        return device
+
+    def _parse_com_object_instance_refs(
+        self, device: DeviceInstance, element: ElementTree.Element
+    ) -> None:
+        """Parse ComObjectInstanceRefs of a device."""
+        device.com_object_instance_refs.extend(
             com_obj_inst_ref
-            for elem in device_element.findall(
-                "{*}ComObjectInstanceRefs/{*}ComObjectInstanceRef"
-            )
+            for elem in element
             if (com_obj_inst_ref := self._create_com_object_instance(elem)) is not None
-        ]
+        )
 
-        module_instances = [
-            module_instance
-            for mi_elem in device_element.findall(
-                "{*}ModuleInstances/{*}ModuleInstance"
+    @staticmethod
+    def _parse_parameter_instance_refs(
+        device: DeviceInstance, element: ElementTree.Element
+    ) -> None:
+        """Parse ParameterInstanceRefs of a device."""
+        parameter_instances = device.parameter_instance_refs
+        for param_instance_node in element:
+            pr_ref_id: str = param_instance_node.get("RefId")  # type: ignore[assignment]
+            parameter_instances[pr_ref_id] = ParameterInstanceRef(
+                ref_id=pr_ref_id,
+                value=param_instance_node.get("Value"),
             )
-            if (module_instance := self._create_module_instance(mi_elem)) is not None
-        ]
 
-        channels = []
-        for channel_node_elem in device_element.findall(
-            "{*}GroupObjectTree//{*}Nodes/{*}Node[@Type='Channel']"
-        ):
+    def _parse_group_object_tree(
+        self, device: DeviceInstance, element: ElementTree.Element
+    ) -> None:
+        """Parse used channels from the GroupObjectTree of a device."""
+        for channel_node_elem in element.iter(self._tag_node):
+            if channel_node_elem.get("Type") != "Channel":
+                continue
             if not (_gos := channel_node_elem.get("GroupObjectInstances")):
                 # parse only used channels
                 continue
-            channels.append(
+            device.channels.append(
                 ChannelNode(
                     ref_id=channel_node_elem.get("RefId"),  # type: ignore[arg-type]
                     name=channel_node_elem.get("Text", ""),
@@ -284,46 +430,41 @@ class _TopologyLoader:
                 )
             )
 
-        parameter_instances = {}
-        for param_instance_node in device_element.findall(
-            "{*}ParameterInstanceRefs/{*}ParameterInstanceRef"
-        ):
-            pr_ref_id: str = param_instance_node.get("RefId")  # type: ignore[assignment]
-            parameter_instances[pr_ref_id] = ParameterInstanceRef(
-                ref_id=pr_ref_id,
-                value=param_instance_node.get("Value"),
-            )
-
-        return DeviceInstance(
-            identifier=device_element.get("Id", ""),
-            address=int(address),
-            project_uid=int(project_uid) if project_uid else None,
-            name=device_element.get("Name", ""),
-            description=device_element.get("Description", ""),
-            last_modified=device_element.get("LastModified", ""),
-            product_ref=product_ref,
-            hardware_program_ref=device_element.get("Hardware2ProgramRefId", ""),
-            line=line,
-            manufacturer=product_ref.split("_", 1)[0],
-            additional_addresses=additional_addresses,
-            channels=channels,
-            com_object_instance_refs=com_obj_inst_refs,
-            module_instances=module_instances,
-            parameter_instance_refs=parameter_instances,
+    def _parse_module_instances(
+        self, device: DeviceInstance, element: ElementTree.Element
+    ) -> None:
+        """Parse ModuleInstances of a device."""
+        device.module_instances.extend(
+            module_instance
+            for mi_elem in element
+            if (module_instance := self._create_module_instance(mi_elem)) is not None
         )
 
     @staticmethod
-    def __get_links_from_ets4(com_object: ElementTree.Element) -> list[str]:
+    def _parse_additional_addresses(
+        device: DeviceInstance, element: ElementTree.Element
+    ) -> None:
+        """Parse AdditionalAddresses of a device."""
+        device.additional_addresses.extend(
+            add_addr
+            for address_elem in element
+            if (add_addr := address_elem.get("Address")) is not None
+        )
+
+    def __get_links_from_ets4(self, com_object: ElementTree.Element) -> list[str]:
         # Check if "Connectors" is available. This will always fail for ETS5/6
-        if (connectors := com_object.find("{*}Connectors")) is None:
+        if (connectors := com_object.find(self._path_connectors)) is None:
             return []
 
         # Send GA is the primary GA, Receive GA are additional group addresses
-        ga_list = connectors.findall("{*}Send") + connectors.findall("{*}Receive")
-
         # Remove the project ID from GA
         return [
-            ga.get("GroupAddressRefId", "").split("_", maxsplit=1)[1] for ga in ga_list
+            ga_ref_id.partition("_")[2]
+            for ga in chain(
+                connectors.iterfind(self._path_send),
+                connectors.iterfind(self._path_receive),
+            )
+            if (ga_ref_id := ga.get("GroupAddressRefId"))
         ]
 
     @staticmethod
@@ -341,29 +482,46 @@ class _TopologyLoader:
         com_object: ElementTree.Element,
     ) -> ComObjectInstanceRef | None:
         """Create ComObjectInstanceRef."""
-
-        if self.__knx_proj_contents.is_ets4_project():
-            links = self.__get_links_from_ets4(com_object)
-        else:
-            links = self.__get_links_from_ets5(com_object)
-
-        if not links:
+        if not (links := self._get_links(com_object)):
             return None
 
+        attrib = com_object.attrib
+        get = attrib.get
+        if attrib.keys() <= _COM_OBJECT_INSTANCE_REF_BASE_ATTRIBUTES:
+            # nothing customized in the project - skip probing for absent attributes
+            return ComObjectInstanceRef(
+                identifier=get("Id"),
+                ref_id=intern_optional(get("RefId")),  # type: ignore[arg-type]
+                text=None,
+                function_text=None,
+                read_flag=None,
+                write_flag=None,
+                communication_flag=None,
+                transmit_flag=None,
+                update_flag=None,
+                read_on_init_flag=None,
+                datapoint_types=[],
+                description=None,
+                channel=None,
+                links=links,
+            )
+
+        # knx:Enable_t lookup - missing flags are None
+        flag = _XML_FLAGS.get
         return ComObjectInstanceRef(
-            identifier=com_object.get("Id"),
-            ref_id=com_object.get("RefId"),  # type: ignore[arg-type]
-            text=com_object.get("Text"),
-            function_text=com_object.get("FunctionText"),
-            read_flag=parse_xml_flag(com_object.get("ReadFlag")),
-            write_flag=parse_xml_flag(com_object.get("WriteFlag")),
-            communication_flag=parse_xml_flag(com_object.get("CommunicationFlag")),
-            transmit_flag=parse_xml_flag(com_object.get("TransmitFlag")),
-            update_flag=parse_xml_flag(com_object.get("UpdateFlag")),
-            read_on_init_flag=parse_xml_flag(com_object.get("ReadOnInitFlag")),
-            datapoint_types=parse_dpt_types(com_object.get("DatapointType")),
-            description=com_object.get("Description"),
-            channel=com_object.get("ChannelId"),
+            identifier=get("Id"),
+            ref_id=intern_optional(get("RefId")),  # type: ignore[arg-type]
+            text=get("Text"),
+            function_text=get("FunctionText"),
+            read_flag=flag(get("ReadFlag"), False),
+            write_flag=flag(get("WriteFlag"), False),
+            communication_flag=flag(get("CommunicationFlag"), False),
+            transmit_flag=flag(get("TransmitFlag"), False),
+            update_flag=flag(get("UpdateFlag"), False),
+            read_on_init_flag=flag(get("ReadOnInitFlag"), False),
+            datapoint_types=parse_dpt_types(get("DatapointType")),
+            description=get("Description"),
+            channel=intern_optional(get("ChannelId")),
             links=links,
         )
 
@@ -377,7 +535,7 @@ class _TopologyLoader:
                 ref_id=arg.get("RefId"),  # type: ignore[arg-type]
                 value=arg.get("Value"),  # type: ignore[arg-type]
             )
-            for arg in module_instance_elem.findall("{*}Arguments/{*}Argument")
+            for arg in module_instance_elem.iterfind(self._path_module_arguments)
         ]
         return ModuleInstance(
             identifier=module_instance_elem.get("Id"),  # type: ignore[arg-type]
@@ -393,16 +551,20 @@ class _LocationLoader:
         self,
         knx_proj_contents: KNXProjContents,
         knx_master_data: KNXMasterData,
-        devices: list[DeviceInstance],
+        namespace: str,
+        devices_by_id: dict[str, str],
     ):
         """Initialize the LocationLoader."""
         self.knx_master_data = knx_master_data
         self._element_name = (
             "BuildingPart" if knx_proj_contents.is_ets4_project() else "Space"
         )
-        self.devices: dict[str, str] = {
-            device.identifier: device.individual_address for device in devices
-        }
+        # "{<namespace uri>}" of the project file - compare tags with literals
+        self._tag_space = f"{namespace}{self._element_name}"
+        self._tag_device_instance_ref = f"{namespace}DeviceInstanceRef"
+        self._tag_function = f"{namespace}Function"
+        self._tag_group_address_ref = f"{namespace}GroupAddressRef"
+        self.devices = devices_by_id
 
     def load(
         self, location_element: ElementTree.Element, functions: list[XMLFunction]
@@ -410,56 +572,77 @@ class _LocationLoader:
         """Load Location mappings."""
         return [
             self.parse_space(space, functions)
-            for space in location_element.findall(f"{{*}}{self._element_name}")
+            for space in location_element
+            if space.tag == self._tag_space
         ]
 
     def parse_space(
         self, node: ElementTree.Element, functions: list[XMLFunction]
     ) -> XMLSpace:
-        """Parse a space from the document."""
-        usage_id = node.get("Usage")
+        """Parse a space and its nested spaces from the document."""
+        root_space = self.create_space(node)
+        # spaces can be nested for an unbound time in the XSD - use an explicit stack
+        # of (space, iterator over its sub nodes) instead of recursion
+        stack = [(root_space, iter(node))]
+        while stack:
+            space, sub_nodes = stack[-1]
+            for sub_node in sub_nodes:
+                if sub_node.tag == self._tag_space:
+                    sub_space = self.create_space(sub_node)
+                    space.spaces.append(sub_space)
+                    # continue with the nested space - remaining sub nodes follow later
+                    stack.append((sub_space, iter(sub_node)))
+                    break
+                if sub_node.tag == self._tag_device_instance_ref:
+                    if individual_address := self.devices.get(
+                        sub_node.get("RefId", "")
+                    ):
+                        space.devices.append(individual_address)
+                elif sub_node.tag == self._tag_function:
+                    function = self.parse_functions(sub_node)
+                    function.space_id = space.identifier
+                    functions.append(function)
+                    space.functions.append(function.identifier)
+            else:
+                stack.pop()
+
+        return root_space
+
+    def create_space(self, node: ElementTree.Element) -> XMLSpace:
+        """Create a space without its sub nodes."""
+        get = node.attrib.get
+        usage_id = intern_optional(get("Usage"))
         usage_text = (
             self.knx_master_data.get_space_usage_name(usage_id) if usage_id else ""
         )
-        project_uid = node.get("Puid")
-        space: XMLSpace = XMLSpace(
-            identifier=node.get("Id"),  # type: ignore[arg-type]
-            name=node.get("Name"),  # type: ignore[arg-type]
-            space_type=SpaceType(node.get("Type")),
+        project_uid = get("Puid")
+        if (space_type := _SPACE_TYPES.get(raw_type := get("Type"))) is None:
+            # not a known Type - let the Enum raise its ValueError
+            space_type = SpaceType(raw_type)
+        return XMLSpace(
+            identifier=get("Id"),  # type: ignore[arg-type]
+            name=get("Name"),  # type: ignore[arg-type]
+            space_type=space_type,
             usage_id=usage_id,
             usage_text=usage_text,
-            number=node.get("Number", ""),
-            description=node.get("Description", ""),
+            number=get("Number", ""),
+            description=get("Description", ""),
             project_uid=int(project_uid) if project_uid else None,
             spaces=[],
             devices=[],
             functions=[],
         )
 
-        for sub_node in node:
-            if sub_node.tag.endswith(self._element_name):
-                # recursively call parse space since this can be nested for an unbound time in the XSD
-                space.spaces.append(self.parse_space(sub_node, functions))
-            elif sub_node.tag.endswith("DeviceInstanceRef"):
-                if individual_address := self.devices.get(sub_node.get("RefId", "")):
-                    space.devices.append(individual_address)
-            elif sub_node.tag.endswith("Function"):
-                function = self.parse_functions(sub_node)
-                function.space_id = space.identifier
-                functions.append(function)
-                space.functions.append(function.identifier)
-
-        return space
-
     def parse_functions(self, node: ElementTree.Element) -> XMLFunction:
         """Parse a functions from the document."""
-        identifier = node.get("Id", "").split("_", 1)[1]
-        project_uid = node.get("Puid")
-        function_type = node.get("Type", "")
+        get = node.attrib.get
+        identifier = get("Id", "").partition("_")[2]
+        project_uid = get("Puid")
+        function_type = get("Type", "")
 
         functions: XMLFunction = XMLFunction(
             identifier=identifier,
-            name=node.get("Name"),  # type: ignore[arg-type]
+            name=get("Name"),  # type: ignore[arg-type]
             function_type=function_type,
             project_uid=int(project_uid) if project_uid else None,
             group_addresses=[],
@@ -468,15 +651,16 @@ class _LocationLoader:
         )
 
         for sub_node in node:
-            if sub_node.tag.endswith("GroupAddressRef"):
-                project_uid = sub_node.get("Puid")
-                ref_id = sub_node.get("RefId", "").split("_", 1)[1]
+            if sub_node.tag == self._tag_group_address_ref:
+                ref_get = sub_node.attrib.get
+                project_uid = ref_get("Puid")
+                ref_id = ref_get("RefId", "").partition("_")[2]
 
                 group_address_ref: XMLGroupAddressRef = XMLGroupAddressRef(
                     ref_id=ref_id,
-                    identifier=sub_node.get("Id"),  # type: ignore[arg-type]
-                    name=sub_node.get("Name"),  # type: ignore[arg-type]
-                    role=sub_node.get("Role", ""),
+                    identifier=ref_get("Id"),  # type: ignore[arg-type]
+                    name=ref_get("Name"),  # type: ignore[arg-type]
+                    role=ref_get("Role", ""),
                     project_uid=int(project_uid) if project_uid else None,
                     address="",
                 )
@@ -485,18 +669,23 @@ class _LocationLoader:
         return functions
 
 
-def load_project_info(tree: ElementTree.ElementTree) -> XMLProjectInformation:
+def load_project_info(knx_root: ElementTree.Element) -> XMLProjectInformation:
     """Load project information."""
-    knx_root = tree.getroot()
-    _namespace_match = re.match(r"{.+\/project\/(.+)}", knx_root.tag)
-    schema_version = _namespace_match.group(1) if _namespace_match else ""
+    # root tag is "{http://knx.org/xml/project/<schema_version>}KNX"
+    namespace = knx_root.tag[1:].partition("}")[0] if knx_root.tag[0] == "{" else ""
+    _, separator, schema_version = namespace.rpartition("/project/")
+    if not separator:
+        schema_version = ""
     created_by = knx_root.get("CreatedBy", "")
     tool_version = knx_root.get("ToolVersion", "")
 
     try:
-        project_node: ElementTree.Element = tree.find("{*}Project")  # type: ignore[assignment]
+        # "{}Tag" matches tags without namespace - same as the root tag
+        project_node: ElementTree.Element = knx_root.find(f"{{{namespace}}}Project")  # type: ignore[assignment]
         identifier = project_node.get("Id", "")
-        info_node: ElementTree.Element = project_node.find("{*}ProjectInformation")  # type: ignore[assignment]
+        info_node: ElementTree.Element = project_node.find(  # type: ignore[assignment]
+            f"{{{namespace}}}ProjectInformation"
+        )
         return XMLProjectInformation(
             project_id=identifier,
             name=info_node.get("Name", ""),
@@ -21,6 +21,19 @@ TranslationsType = dict[str, dict[str, str]]
 class XMLGroupAddress:
     """Class that represents a group address."""
 
+    __slots__ = (
+        "address",
+        "comment",
+        "data_secure_key",
+        "description",
+        "dpt",
+        "identifier",
+        "name",
+        "project_uid",
+        "raw_address",
+        "style",
+    )
+
     def __init__(
         self,
         name: str,
@@ -35,7 +48,7 @@ class XMLGroupAddress:
     ):
         """Initialize a group address."""
         self.name = name
-        self.identifier = identifier.split("_", 1)[1]
+        self.identifier = identifier.partition("_")[2]
         self.raw_address = int(address)
         self.project_uid = project_uid
         self.description = description
@@ -71,6 +84,16 @@ class XMLGroupAddress:
 class XMLGroupRange:
     """Class that represents a group range."""
 
+    __slots__ = (
+        "comment",
+        "group_addresses",
+        "group_ranges",
+        "name",
+        "range_end",
+        "range_start",
+        "style",
+    )
+
     name: str
     range_start: int
     range_end: int
@@ -101,6 +124,8 @@ class XMLGroupRange:
 class XMLArea:
     """Class that represents a area."""
 
+    __slots__ = ("address", "description", "lines", "name")
+
     address: int
     name: str
     description: str | None
@@ -111,6 +136,8 @@ class XMLArea:
 class XMLLine:
     """Class that represents a Line."""
 
+    __slots__ = ("address", "area", "description", "devices", "medium_type", "name")
+
     address: int
     description: str | None
     name: str
@@ -122,6 +149,33 @@ class XMLLine:
 class DeviceInstance:
     """Class that represents a device instance."""
 
+    __slots__ = (
+        "additional_addresses",
+        "address",
+        "application_program_ref",
+        "area_address",
+        "channels",
+        "com_object_instance_refs",
+        "com_objects",
+        "description",
+        "hardware_name",
+        "hardware_program_ref",
+        "identifier",
+        "individual_address",
+        "last_modified",
+        "line",
+        "line_address",
+        "manufacturer",
+        "manufacturer_name",
+        "module_instances",
+        "name",
+        "order_number",
+        "parameter_instance_refs",
+        "product_name",
+        "product_ref",
+        "project_uid",
+    )
+
     def __init__(
         self,
         *,
@@ -221,6 +275,8 @@ class DeviceInstance:
 class ChannelNode:
     """Class that represents a Node with Type Channel."""
 
+    __slots__ = ("group_object_instances", "name", "ref_id")
+
     ref_id: str  # name="RefId" type="knx:RELIDREF" use="required"
     name: str  # name="Text" type="xs:string" use="optional"
     group_object_instances: list[
@@ -592,6 +648,8 @@ class ComObjectInstanceRef:
 class ParameterInstanceRef:
     """ParameterInstanceRef."""
 
+    __slots__ = ("ref_id", "value")
+
     ref_id: str
     value: str | None
 
@@ -803,6 +861,20 @@ class KNXMasterData:
 class XMLSpace:
     """A space in the location XML."""
 
+    __slots__ = (
+        "description",
+        "devices",
+        "functions",
+        "identifier",
+        "name",
+        "number",
+        "project_uid",
+        "space_type",
+        "spaces",
+        "usage_id",
+        "usage_text",
+    )
+
     identifier: str
     name: str
     space_type: SpaceType
@@ -820,6 +892,16 @@ class XMLSpace:
 class XMLFunction:
     """A functions in the space XML."""
 
+    __slots__ = (
+        "function_type",
+        "group_addresses",
+        "identifier",
+        "name",
+        "project_uid",
+        "space_id",
+        "usage_text",
+    )
+
     function_type: str
     group_addresses: list[XMLGroupAddressRef]
     identifier: str
@@ -833,6 +915,8 @@ class XMLFunction:
 class XMLGroupAddressRef:
     """A GroupAddressRef in the functions XML."""
 
+    __slots__ = ("address", "identifier", "name", "project_uid", "ref_id", "role")
+
     address: str
     identifier: str
     name: str
@@ -2,8 +2,10 @@
 
 from __future__ import annotations
 
+from functools import cache
 import logging
 import re
+import sys
 from typing import TYPE_CHECKING, overload
 
 from xknxproject.const import MAIN_AND_SUB_DPT, MAIN_DPT
@@ -19,42 +21,38 @@ _LOGGER = logging.getLogger("xknxproject.log")
 def get_dpt_type(dpt_string: str | None) -> DPTType | None:
     """Parse DPT type from the XML representation to main and sub types."""
     # GroupAddress tags should only support one single DPT.
-    try:
-        return parse_dpt_types(dpt_string)[0]
-    except IndexError:
-        return None
+    if dpt_string and (dpt_values := _parse_dpt_values(dpt_string)):
+        main, sub = dpt_values[0]
+        return DPTType(main=main, sub=sub)
+    return None
 
 
 def parse_dpt_types(dpt_string: str | None) -> list[DPTType]:
     """Parse all DPTs from the XML representation to main and sub types."""
     if not dpt_string:
         return []
+    # DPTType dicts end up in the result - don't share cached mutable objects
+    return [DPTType(main=main, sub=sub) for main, sub in _parse_dpt_values(dpt_string)]
+
 
-    supported_dpts: list[DPTType] = []
+@cache
+def _parse_dpt_values(dpt_string: str) -> tuple[tuple[int, int | None], ...]:
+    """Parse DPTs to (main, sub) tuples - cached as only few distinct values exist."""
+    supported_dpts: list[tuple[int, int | None]] = []
     # some applications have listed same DPT multiple times `DatapointType="DPST-1-1 DPST-1-1"`
     # so we use dict.fromkeys() (as set() doesn't preserve order)
     for _dpt in dict.fromkeys(dpt_string.split()):
         dpt_parts = _dpt.split("-")
         try:
             if dpt_parts[0] == MAIN_DPT:
-                supported_dpts.append(
-                    DPTType(
-                        main=int(dpt_parts[1]),
-                        sub=None,
-                    )
-                )
+                supported_dpts.append((int(dpt_parts[1]), None))
             if dpt_parts[0] == MAIN_AND_SUB_DPT:
-                supported_dpts.append(
-                    DPTType(
-                        main=int(dpt_parts[1]),
-                        sub=int(dpt_parts[2]),
-                    )
-                )
+                supported_dpts.append((int(dpt_parts[1]), int(dpt_parts[2])))
         except (IndexError, ValueError):
             _LOGGER.warning(
                 'Could not parse DPTType from: "%s" in "%s"', _dpt, dpt_string
             )
-    return supported_dpts
+    return tuple(supported_dpts)
 
 
 @overload
@@ -72,6 +70,21 @@ def parse_xml_flag(flag: str | None, default: bool | None = None) -> bool | None
     return flag == "Enabled"
 
 
+@overload
+def intern_optional(text: str) -> str: ...
+
+
+@overload
+def intern_optional(text: str | None) -> str | None: ...
+
+
+def intern_optional(text: str | None) -> str | None:
+    """Intern a frequently repeated string to share a single instance."""
+    if text is None:
+        return None
+    return sys.intern(text)
+
+
 def text_parameter_template_replace(
     text: str, parameter: ParameterInstanceRef | None
 ) -> str:
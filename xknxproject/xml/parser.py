@@ -169,15 +169,14 @@ class XMLParser:
 
         products_dict: dict[str, Product] = {}
         hardware_application_map: HardwareToPrograms = {}
-        for _products, _hardware_programs in [
-            HardwareLoader.load(
+        for hardware_file in HardwareLoader.get_hardware_file_names(
+            project_contents=self.knx_proj_contents
+        ):
+            _products, _hardware_programs = HardwareLoader.load_from_archive(
+                archive=self.knx_proj_contents.root,
                 hardware_file=hardware_file,
                 language_code=self.language_code,
             )
-            for hardware_file in HardwareLoader.get_hardware_files(
-                project_contents=self.knx_proj_contents
-            )
-        ]:
             products_dict.update(_products)
             hardware_application_map.update(_hardware_programs)
 
@@ -231,12 +230,13 @@ class XMLParser:
         )
         applications: dict[str, ApplicationProgram] = {}
         for application_program_file, devices in application_programs.items():
-            applications[application_program_file] = ApplicationProgramLoader.load(
-                application_program_path=(
-                    self.knx_proj_contents.root_path / application_program_file
-                ),
-                devices=devices,
-                language_code=self.language_code,
+            applications[application_program_file] = (
+                ApplicationProgramLoader.load_from_archive(
+                    archive=self.knx_proj_contents.root,
+                    application_program_file=application_program_file,
+                    devices=devices,
+                    language_code=self.language_code,
+                )
             )
 
         for device in self.devices: